@@ -17,7 +17,11 @@ Role-based access:
 import os
 import re
 import csv
+import hashlib
+import hmac
+import queue
 import sqlite3
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -30,6 +34,9 @@ INVOICE_DIR = APP_DIR / "invoices"
 APP_DIR.mkdir(parents=True, exist_ok=True)
 INVOICE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Compiled once at import so the validator skips re's per-call cache lookup
+_EMAIL_RE = re.compile(r"[\w\.-]+@[\w\.-]+\.\w+")
+
 # ---------- Custom Exceptions ----------
 class ValidationError(Exception):
     """Raised when input validation fails."""
@@ -70,11 +77,55 @@ class Book:
 
 # ---------- Database Layer ----------
 class LibraryDB:
+    # Hot-path SQL kept as constants so repeated calls reuse the same
+    # string objects (and sqlite3's per-connection statement cache).
+    _SQL_BORROW_CHECK = "SELECT available FROM books WHERE book_id=?"
+    _SQL_BORROW_DEC = "UPDATE books SET available=available-1 WHERE book_id=?"
+    _SQL_BORROW_INS = ("INSERT INTO transactions(member_id,book_id,borrow_date,due_date) "
+                       "VALUES(?,?,?,?)")
+
     def __init__(self, db_path=DB_PATH):
-        self.conn = sqlite3.connect(db_path)
+        # URI open; WAL (below) already gives the main and worker
+        # connections safe concurrent access through the busy handler.
+        # check_same_thread=False lets a worker thread use the handle as
+        # long as access stays serialized.
+        self.conn = sqlite3.connect(f"file:{db_path}", uri=True,
+                                    check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
+        # WAL avoids the fsync-per-commit of the rollback journal; NORMAL is
+        # safe with WAL and keeps bulk inserts from stalling on disk flushes.
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        self.conn.execute("PRAGMA mmap_size=268435456")  # mmap reads up to 256 MB
+        # Let SQLite run the regex per row in its own loop instead of
+        # shipping every row to Python first.
+        self._regex_cache = {}
+        self.conn.create_function("REGEXP", 2, self._regexp, deterministic=True)
         self._init_schema()
 
+    def _compile_cached(self, pattern):
+        rgx = self._regex_cache.get(pattern)
+        if rgx is None:
+            rgx = self._regex_cache.setdefault(pattern, re.compile(pattern, re.IGNORECASE))
+        return rgx
+
+    def _regexp(self, pattern, value):
+        return self._compile_cached(pattern).search(value or "") is not None
+
+    def _bind_rx(self, pattern):
+        """Register RX(value) bound to one precompiled pattern.
+
+        A single-arg closure saves marshalling the pattern string and the
+        cache lookup on every row; re-registering just replaces the
+        previous query's closure.
+        """
+        search = self._compile_cached(pattern).search
+        self.conn.create_function("RX", 1,
+                                  lambda v, _s=search: _s(v or "") is not None,
+                                  deterministic=True)
+
     def _init_schema(self):
         cur = self.conn.cursor()
         cur.executescript(
@@ -103,6 +154,10 @@ class LibraryDB:
                 FOREIGN KEY(member_id) REFERENCES members(member_id),
                 FOREIGN KEY(book_id) REFERENCES books(book_id)
             );
+            CREATE INDEX IF NOT EXISTS idx_books_title ON books(title COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_tx_active ON transactions(tx_id DESC)
+                WHERE return_date IS NULL;
+            CREATE INDEX IF NOT EXISTS idx_tx_member ON transactions(member_id, book_id);
             """
         )
         self.conn.commit()
@@ -117,6 +172,17 @@ class LibraryDB:
             )
             return cur.lastrowid
 
+    def add_members_bulk(self, members) -> int:
+        # validate everything first so a bad row aborts before any write
+        for m in members:
+            self._validate_email(m.email)
+        with self.conn:  # one transaction (and one fsync) for the whole batch
+            self.conn.executemany(
+                "INSERT INTO members(name,email) VALUES(?,?)",
+                [(m.name, m.email) for m in members],
+            )
+        return len(members)
+
     def update_member(self, member_id: int, name: str, email: str):
         self._validate_email(email)
         with self.conn:
@@ -125,13 +191,30 @@ class LibraryDB:
                 (name, email, member_id),
             )
 
-    def list_members(self, pattern: str = ""):
-        # regex search in Python after fetching (simple demo)
-        rows = self.conn.execute("SELECT * FROM members").fetchall()
+    def _members_cursor(self, pattern: str = ""):
+        # regex search pushed into the WHERE clause (see _regexp)
         if not pattern:
-            return rows
-        rgx = re.compile(pattern, re.IGNORECASE)
-        return [r for r in rows if rgx.search(r["name"]) or rgx.search(r["email"])]
+            return self.conn.execute("SELECT * FROM members")
+        self._bind_rx(pattern)
+        return self.conn.execute(
+            "SELECT * FROM members WHERE RX(name) OR RX(email)")
+
+    def list_members(self, pattern: str = ""):
+        return self._members_cursor(pattern).fetchall()
+
+    def count_members(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM members").fetchone()[0]
+
+    def page_members(self, limit: int, offset: int = 0):
+        # explicit column list in tree-column order, so the UI can pass
+        # rows through positionally
+        return self.conn.execute(
+            "SELECT member_id,name,email FROM members ORDER BY member_id LIMIT ? OFFSET ?",
+            (limit, offset)).fetchall()
+
+    def iter_members(self, pattern: str = ""):
+        # streams rows straight off the cursor, no list materialization
+        yield from self._members_cursor(pattern)
 
     # ------------- Books -------------
     def add_book(self, b: Book) -> int:
@@ -143,6 +226,16 @@ class LibraryDB:
             )
             return cur.lastrowid
 
+    def add_books_bulk(self, books) -> int:
+        for b in books:
+            self._validate_isbn(b.isbn)
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO books(title,author,genre,isbn,available) VALUES(?,?,?,?,?)",
+                [(b.title, b.author, b.genre, b.isbn, b.available) for b in books],
+            )
+        return len(books)
+
     def update_book(self, book_id: int, title: str, author: str, genre: str, isbn: str, available: int):
         self._validate_isbn(isbn)
         with self.conn:
@@ -151,31 +244,81 @@ class LibraryDB:
                 (title, author, genre, isbn, available, book_id),
             )
 
-    def list_books(self, pattern: str = ""):
-        rows = self.conn.execute("SELECT * FROM books").fetchall()
+    def _books_cursor(self, pattern: str = ""):
         if not pattern:
-            return rows
-        rgx = re.compile(pattern, re.IGNORECASE)
-        out = []
-        for r in rows:
-            if any(rgx.search(str(r[k])) for k in ("title","author","genre","isbn")):
-                out.append(r)
-        return out
+            return self.conn.execute("SELECT * FROM books")
+        if pattern.isascii() and not re.search(r"[.^$*+?{}\[\]\\|()%_]", pattern):
+            # Plain ASCII text: C-level LIKE beats calling back into Python
+            # per row. % and _ count as metacharacters here — they are LIKE
+            # wildcards — and non-ASCII text stays on the regex path, since
+            # LIKE only case-folds ASCII.
+            like = f"%{pattern}%"
+            return self.conn.execute(
+                "SELECT * FROM books WHERE title LIKE ? OR author LIKE ? "
+                "OR genre LIKE ? OR isbn LIKE ?",
+                (like, like, like, like),
+            )
+        self._bind_rx(pattern)
+        return self.conn.execute(
+            "SELECT * FROM books WHERE RX(title) OR RX(author) "
+            "OR RX(genre) OR RX(isbn)")
+
+    def list_books(self, pattern: str = ""):
+        return self._books_cursor(pattern).fetchall()
+
+    def count_books(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM books").fetchone()[0]
+
+    def page_books(self, limit: int, offset: int = 0):
+        return self.conn.execute(
+            "SELECT book_id,title,author,genre,isbn,available FROM books "
+            "ORDER BY book_id LIMIT ? OFFSET ?",
+            (limit, offset)).fetchall()
+
+    def iter_books(self, pattern: str = ""):
+        yield from self._books_cursor(pattern)
 
     # ------------- Borrow/Return -------------
     def borrow_book(self, member_id: int, book_id: int, days: int = 7):
         # use try/except for errors
         try:
             with self.conn:
-                book = self.conn.execute("SELECT available FROM books WHERE book_id=?", (book_id,)).fetchone()
+                book = self.conn.execute(self._SQL_BORROW_CHECK, (book_id,)).fetchone()
                 if not book or book["available"] <= 0:
                     raise ValidationError("Book not available")
-                self.conn.execute("UPDATE books SET available=available-1 WHERE book_id=?", (book_id,))
+                self.conn.execute(self._SQL_BORROW_DEC, (book_id,))
                 now = datetime.now()
                 due = now + timedelta(days=days)
                 self.conn.execute(
-                    "INSERT INTO transactions(member_id,book_id,borrow_date,due_date) VALUES(?,?,?,?)",
-                    (member_id, book_id, now.isoformat(), due.date().isoformat()),
+                    self._SQL_BORROW_INS,
+                    (member_id, book_id, now.isoformat(timespec="seconds"),
+                     due.date().isoformat()),
+                )
+        except sqlite3.Error as e:
+            raise ValidationError(f"DB error: {e}")
+
+    def borrow_many(self, pairs, days: int = 7):
+        """Bulk checkout of (member_id, book_id) pairs in one transaction."""
+        # timestamps computed once for the whole batch, not per row
+        now = datetime.now()
+        now_iso = now.isoformat(timespec="seconds")
+        due_iso = (now + timedelta(days=days)).date().isoformat()
+        # aggregate per book so a batch can't pass the check individually
+        # and then decrement stock below zero
+        needed = {}
+        for _, book_id in pairs:
+            needed[book_id] = needed.get(book_id, 0) + 1
+        try:
+            with self.conn:
+                for book_id, count in needed.items():
+                    book = self.conn.execute(self._SQL_BORROW_CHECK, (book_id,)).fetchone()
+                    if not book or book["available"] < count:
+                        raise ValidationError(f"Book {book_id} not available")
+                self.conn.executemany(self._SQL_BORROW_DEC,
+                                      [(book_id,) for _, book_id in pairs])
+                self.conn.executemany(
+                    self._SQL_BORROW_INS,
+                    [(member_id, book_id, now_iso, due_iso) for member_id, book_id in pairs],
                 )
         except sqlite3.Error as e:
             raise ValidationError(f"DB error: {e}")
@@ -183,28 +326,54 @@ class LibraryDB:
     def return_book(self, tx_id: int, fine_per_day: int = 5):
         try:
             with self.conn:
-                tx = self.conn.execute("SELECT * FROM transactions WHERE tx_id=?", (tx_id,)).fetchone()
+                tx = self.conn.execute(
+                    "SELECT book_id, return_date FROM transactions WHERE tx_id=?",
+                    (tx_id,)).fetchone()
                 if not tx or tx["return_date"]:
                     raise ValidationError("Invalid transaction or already returned")
-                due = datetime.fromisoformat(tx["due_date"] + "T00:00:00")
-                today = datetime.now()
-                overdue_days = max((today - due).days, 0)
-                fine = overdue_days * fine_per_day
-                self.conn.execute("UPDATE transactions SET return_date=?, fine=? WHERE tx_id=?",
-                                  (today.date().isoformat(), fine, tx_id))
+                # SQLite computes the overdue days and fine itself; no
+                # datetime parsing or arithmetic in Python
+                self.conn.execute(
+                    "UPDATE transactions SET return_date=date('now','localtime'), "
+                    "fine = MAX(CAST(julianday(date('now','localtime')) - julianday(due_date) "
+                    "AS INTEGER), 0) * ? WHERE tx_id=?",
+                    (fine_per_day, tx_id))
                 self.conn.execute("UPDATE books SET available=available+1 WHERE book_id=?", (tx["book_id"],))
-                return fine
+                return self.conn.execute(
+                    "SELECT fine FROM transactions WHERE tx_id=?", (tx_id,)).fetchone()[0]
         except sqlite3.Error as e:
             raise ValidationError(f"DB error: {e}")
 
     def active_loans(self):
         return self.conn.execute(
-            "SELECT t.*, m.name as member_name, b.title as book_title FROM transactions t "
+            "SELECT t.tx_id, m.name as member_name, b.title as book_title, "
+            "t.borrow_date, t.due_date FROM transactions t "
             "JOIN members m ON m.member_id=t.member_id "
             "JOIN books b ON b.book_id=t.book_id "
             "WHERE t.return_date IS NULL ORDER BY t.tx_id DESC"
         ).fetchall()
 
+    def overdue_loans(self):
+        # due_date is ISO YYYY-MM-DD, so SQLite compares and subtracts the
+        # dates itself; no datetime parsing per row in Python.
+        return self.conn.execute(
+            "SELECT t.*, m.name as member_name, b.title as book_title, "
+            "CAST(julianday(date('now','localtime')) - julianday(t.due_date) AS INTEGER) AS overdue_days "
+            "FROM transactions t "
+            "JOIN members m ON m.member_id=t.member_id "
+            "JOIN books b ON b.book_id=t.book_id "
+            "WHERE t.return_date IS NULL AND t.due_date < date('now','localtime') "
+            "ORDER BY t.tx_id DESC"
+        ).fetchall()
+
+    def get_tx(self, tx_id: int):
+        return self.conn.execute(
+            "SELECT t.*, m.name as member_name, b.title as book_title FROM transactions t "
+            "JOIN members m ON m.member_id=t.member_id "
+            "JOIN books b ON b.book_id=t.book_id WHERE t.tx_id=?",
+            (tx_id,),
+        ).fetchone()
+
     def history(self):
         return self.conn.execute(
             "SELECT t.*, m.name as member_name, b.title as book_title FROM transactions t "
@@ -215,19 +384,39 @@ class LibraryDB:
     # ------------- Validators -------------
     @staticmethod
     def _validate_email(email: str):
-        if not re.match(r"^[\w\.-]+@[\w\.-]+\.\w+$", email):
+        if not _EMAIL_RE.fullmatch(email):
             raise ValidationError("Invalid email format")
 
     @staticmethod
     def _validate_isbn(isbn: str):
-        # Simple regex: 10 or 13 digits, optionally with dashes
-        if not re.match(r"^(97(8|9))?\d{9}(\d|X)$|^\d{1,5}-\d{1,7}-\d{1,7}-[\dX]$", isbn):
-            raise ValidationError("Invalid ISBN")
+        # Checksum validation: O(n) with no regex backtracking, and stricter
+        # than the old pattern (it verifies the check digit).
+        digits = isbn.replace("-", "")
+        if len(digits) == 10 and digits[:9].isdigit() and (digits[9].isdigit() or digits[9] == "X"):
+            s = sum((10 - i) * (10 if c == "X" else int(c)) for i, c in enumerate(digits))
+            if s % 11 == 0:
+                return
+        elif len(digits) == 13 and digits.isdigit():
+            s = sum(int(c) * (1 if i % 2 == 0 else 3) for i, c in enumerate(digits))
+            if s % 10 == 0:
+                return
+        raise ValidationError("Invalid ISBN")
 
 # ---------- Invoice Generator (File I/O) ----------
 class InvoiceGenerator:
     TAX_RATE = 0.0  # demo: zero tax; change if needed
 
+    # One template, one format call per invoice instead of an f-string per line
+    _TXT_TEMPLATE = (
+        "LibraDesk Invoice\n"
+        "Transaction: {tx_id}\n"
+        "Member: {member}\n"
+        "Book: {book}\n"
+        "Fine: ₹{fine}\n"
+        "Tax: ₹{tax}\n"
+        "Total: ₹{total}\n"
+    )
+
     def __init__(self, out_dir=INVOICE_DIR):
         self.out_dir = Path(out_dir)
         self.out_dir.mkdir(parents=True, exist_ok=True)
@@ -246,19 +435,22 @@ class InvoiceGenerator:
         if as_csv:
             path = self.out_dir / f"{base}.csv"
             with open(path, "w", newline="", encoding="utf-8") as f:
-                w = csv.writer(f)
-                w.writerow(["TX_ID","Member","Book","Fine","Tax","Total"])
-                w.writerow([tx_row["tx_id"], member, book, fine, tax, total])
+                csv.writer(f).writerows([
+                    ["TX_ID","Member","Book","Fine","Tax","Total"],
+                    [tx_row["tx_id"], member, book, fine, tax, total],
+                ])
         else:
             path = self.out_dir / f"{base}.txt"
-            with open(path, "w", encoding="utf-8") as f:
-                f.write("LibraDesk Invoice\n")
-                f.write(f"Transaction: {tx_row['tx_id']}\n")
-                f.write(f"Member: {member}\n")
-                f.write(f"Book: {book}\n")
-                f.write(f"Fine: ₹{fine}\n")
-                f.write(f"Tax: ₹{tax}\n")
-                f.write(f"Total: ₹{total}\n")
+            data = self._TXT_TEMPLATE.format_map({
+                "tx_id": tx_row["tx_id"], "member": member, "book": book,
+                "fine": fine, "tax": tax, "total": total,
+            }).encode("utf-8")
+            # raw fd write skips the TextIOWrapper layer for this tiny file
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
         return path
 
 # ---------- Auth ----------
@@ -267,17 +459,85 @@ USERS = {
     "librarian": {"password": "lib123", "role": "librarian"},
 }
 
+# Hashed once at import; login compares digests in constant time instead of
+# comparing plaintext with ==.
+USERS_HASHED = {
+    u: (hashlib.sha256(v["password"].encode()).digest(), v["role"])
+    for u, v in USERS.items()
+}
+
 # ---------- GUI ----------
 class LibraDeskApp(tk.Tk):
+    _PAGE = 200  # rows fetched per scroll window for the big tables
+
     def __init__(self):
         super().__init__()
         self.title("LibraDesk — Digital Library Manager")
         self.geometry("1050x650")
-        self.db = LibraryDB()
+        self.db = LibraryDB()  # main-thread connection (seeding, startup)
         self.invoice_gen = InvoiceGenerator()
         self.user = None
+        # DB work runs on a worker thread so callbacks never block the
+        # event loop; results come back through a queue polled via after().
+        self._db_q = queue.Queue()
+        self._result_q = queue.Queue()
+        threading.Thread(target=self._db_worker, daemon=True).start()
+        self.after(50, self._drain_results)
         self._render_login()
 
+    # ---------- Background DB worker ----------
+    def _db_worker(self):
+        try:
+            db = LibraryDB()  # worker-owned connection; sqlite handles are thread-affine
+        except Exception as e:
+            # surface the failure instead of dying silently and leaving
+            # every queued request (and button) hanging forever
+            self._result_q.put((self._on_worker_failed, e))
+            return
+        while True:
+            method, args, on_done = self._db_q.get()
+            try:
+                result = getattr(db, method)(*args)
+            except Exception as e:
+                result = e
+            self._result_q.put((on_done, result))
+
+    def _on_worker_failed(self, e):
+        messagebox.showerror("Fatal", f"Database worker failed to start: {e}")
+
+    def _db_call(self, method, args, on_done):
+        """Run a LibraryDB method off the main thread; on_done(result) runs
+        back on the Tk thread and receives the exception object on failure."""
+        self._db_q.put((method, args, on_done))
+
+    def _drain_results(self):
+        try:
+            while True:
+                on_done, result = self._result_q.get_nowait()
+                try:
+                    on_done(result)
+                except tk.TclError:
+                    pass  # widget went away (e.g. logout) before the result
+        except queue.Empty:
+            pass
+        self.after(50, self._drain_results)
+
+    def _mirror_var(self, form, key, var):
+        """Keep form[key] in sync with a Tk variable via a write trace, so
+        submit handlers read plain Python values with no Tcl round-trip."""
+        def _sync(*_):
+            try:
+                form[key] = var.get()
+            except tk.TclError:
+                # non-numeric text in an IntVar entry: record a sentinel so
+                # submit-time validation fails instead of using stale data
+                form[key] = None
+        var.trace_add("write", _sync)
+
+    def _show_db_error(self, e):
+        kind = "Validation" if isinstance(e, ValidationError) else "Error"
+        messagebox.showerror(kind, str(e))
+
     # ---------- Login ----------
     def _render_login(self):
         self.login_frame = ttk.Frame(self)
@@ -292,9 +552,10 @@ class LibraDeskApp(tk.Tk):
 
     def _do_login(self):
         u, p = self.u_var.get().strip(), self.p_var.get().strip()
-        record = USERS.get(u)
-        if record and record["password"] == p:
-            self.user = {"username": u, "role": record["role"]}
+        record = USERS_HASHED.get(u)
+        digest = hashlib.sha256(p.encode()).digest()
+        if record and hmac.compare_digest(record[0], digest):
+            self.user = {"username": u, "role": record[1]}
             self.login_frame.destroy()
             self._render_main()
         else:
@@ -333,6 +594,52 @@ class LibraDeskApp(tk.Tk):
                 except tk.TclError:
                     pass
 
+    def _sync_tree(self, tree, iid_map, rows):
+        """Diff-update a Treeview in place.
+
+        rows yields (pk, values) in display order. Only rows that actually
+        changed get a Tcl call, instead of tearing down and re-inserting
+        the whole table on every refresh.
+        """
+        if not iid_map:
+            rows = iter(rows)
+            first = next(rows, None)
+            if first is None:
+                return  # nothing to load; leave the layout alone
+            # Initial bulk load: unmap the widget so Tk doesn't redraw per
+            # insert, and bind insert to a local to skip attribute lookups.
+            pack_info = tree.pack_info()
+            slaves = tree.master.pack_slaves()
+            idx = slaves.index(tree)
+            if idx + 1 < len(slaves):
+                # pack_info() carries no order, so anchor the re-pack in
+                # front of the widget that currently follows the tree
+                pack_info["before"] = slaves[idx + 1]
+            tree.pack_forget()
+            _ins = tree.insert
+            try:
+                pk, values = first
+                iid_map[pk] = _ins("", "end", values=values)
+                for pk, values in rows:
+                    iid_map[pk] = _ins("", "end", values=values)
+            finally:
+                tree.pack(**pack_info)
+            return
+        seen = set()
+        for pos, (pk, values) in enumerate(rows):
+            seen.add(pk)
+            iid = iid_map.get(pk)
+            if iid is None:
+                iid_map[pk] = tree.insert("", pos, values=values)
+                continue
+            if tuple(map(str, tree.item(iid, "values"))) != tuple(map(str, values)):
+                tree.item(iid, values=values)
+            if tree.index(iid) != pos:
+                tree.move(iid, "", pos)
+        for pk in list(iid_map):
+            if pk not in seen:
+                tree.delete(iid_map.pop(pk))
+
     def _logout(self):
         self.notebook.destroy()
         for child in self.winfo_children():
@@ -360,7 +667,12 @@ class LibraDeskApp(tk.Tk):
         # table
         table_frm = ttk.LabelFrame(frm, text="Members")
         table_frm.pack(fill="both", expand=True, padx=10, pady=10)
-        self.members_tree = ttk.Treeview(table_frm, columns=("id","name","email"), show="headings")
+        self._members_iids = {}  # member_id -> tree item id, for diff refreshes
+        self._members_total = 0
+        self._members_loaded = 0
+        self._members_loading = False
+        self.members_tree = ttk.Treeview(table_frm, columns=("id","name","email"), show="headings",
+                                         yscrollcommand=self._on_members_scroll)
         for i, h in enumerate(("ID","Name","Email")):
             self.members_tree.heading(i if i else "id", text=h)
         self.members_tree.heading("id", text="ID")
@@ -370,30 +682,70 @@ class LibraDeskApp(tk.Tk):
         self._refresh_members()
 
     def _add_member(self):
-        try:
-            member = Member(name=self.m_name.get().strip(), email=self.m_email.get().strip())
-            new_id = self.db.add_member(member)
-            messagebox.showinfo("Success", f"Member added with ID {new_id}")
-            self._refresh_members()
-        except ValidationError as e:
-            messagebox.showerror("Validation", str(e))
+        member = Member(name=self.m_name.get().strip(), email=self.m_email.get().strip())
+        self._db_call("add_member", (member,), self._on_member_added)
+
+    def _on_member_added(self, result):
+        if isinstance(result, Exception):
+            self._show_db_error(result)
+            return
+        messagebox.showinfo("Success", f"Member added with ID {result}")
+        self._refresh_members()
 
     def _update_member(self):
         try:
             mid = int(self.m_id.get())
-            self.db.update_member(mid, self.m_name.get().strip(), self.m_email.get().strip())
-            messagebox.showinfo("Updated", "Member updated")
-            self._refresh_members()
         except ValueError:
             messagebox.showerror("Error", "Enter a valid Member ID")
-        except ValidationError as e:
-            messagebox.showerror("Validation", str(e))
+            return
+        self._db_call("update_member",
+                      (mid, self.m_name.get().strip(), self.m_email.get().strip()),
+                      self._on_member_updated)
+
+    def _on_member_updated(self, result):
+        if isinstance(result, Exception):
+            self._show_db_error(result)
+            return
+        messagebox.showinfo("Updated", "Member updated")
+        self._refresh_members()
 
     def _refresh_members(self):
-        for r in self.members_tree.get_children():
-            self.members_tree.delete(r)
-        for row in self.db.list_members():
-            self.members_tree.insert("", "end", values=(row["member_id"], row["name"], row["email"]))
+        # only the loaded scroll window is fetched; the rest loads on demand
+        self._db_call("count_members", (), self._set_members_total)
+        self._db_call("page_members", (max(self._members_loaded, self._PAGE), 0),
+                      self._apply_members)
+
+    def _set_members_total(self, total):
+        if not isinstance(total, Exception):
+            self._members_total = total
+
+    def _apply_members(self, rows):
+        if isinstance(rows, Exception):
+            return
+        # rows arrive in tree-column order; index access skips sqlite3.Row's
+        # per-field name scan
+        self._sync_tree(self.members_tree, self._members_iids,
+                        ((row[0], tuple(row)) for row in rows))
+        self._members_loaded = len(rows)
+
+    def _on_members_scroll(self, first, last):
+        # near the bottom of the loaded window: pull in the next page
+        if (float(last) > 0.9 and not self._members_loading
+                and self._members_loaded < self._members_total):
+            self._members_loading = True
+            self._db_call("page_members", (self._PAGE, self._members_loaded),
+                          self._append_members)
+
+    def _append_members(self, rows):
+        self._members_loading = False
+        if isinstance(rows, Exception):
+            return
+        _ins = self.members_tree.insert
+        for row in rows:
+            pk = row[0]
+            if pk not in self._members_iids:
+                self._members_iids[pk] = _ins("", "end", values=tuple(row))
+        self._members_loaded += len(rows)
 
     # ---------- Books UI ----------
     def _build_books_tab(self):
@@ -401,8 +753,12 @@ class LibraDeskApp(tk.Tk):
         form = ttk.LabelFrame(frm, text="Add / Update Book")
         form.pack(fill="x", padx=10, pady=10)
         self.b_id = tk.StringVar()
-        self.b_title, self.b_author, self.b_genre, self.b_isbn = map(tk.StringVar, range(4))
+        self.b_title, self.b_author, self.b_genre, self.b_isbn = (tk.StringVar() for _ in range(4))
         self.b_avail = tk.IntVar(value=1)
+        self._book_form = {"id": "", "title": "", "author": "", "genre": "", "isbn": "", "avail": 1}
+        for key, var in (("id", self.b_id), ("title", self.b_title), ("author", self.b_author),
+                         ("genre", self.b_genre), ("isbn", self.b_isbn), ("avail", self.b_avail)):
+            self._mirror_var(self._book_form, key, var)
         labels = ["Book ID (for update)", "Title", "Author", "Genre", "ISBN", "Available"]
         entries = [
             ttk.Entry(form, textvariable=self.b_id, width=10),
@@ -420,46 +776,95 @@ class LibraDeskApp(tk.Tk):
 
         table_frm = ttk.LabelFrame(frm, text="Books")
         table_frm.pack(fill="both", expand=True, padx=10, pady=10)
-        self.books_tree = ttk.Treeview(table_frm, columns=("id","title","author","genre","isbn","avail"), show="headings")
+        self._books_iids = {}
+        self._books_total = 0
+        self._books_loaded = 0
+        self._books_loading = False
+        self.books_tree = ttk.Treeview(table_frm, columns=("id","title","author","genre","isbn","avail"), show="headings",
+                                       yscrollcommand=self._on_books_scroll)
         for col, head in zip(("id","title","author","genre","isbn","avail"), ("ID","Title","Author","Genre","ISBN","Available")):
             self.books_tree.heading(col, text=head)
         self.books_tree.pack(fill="both", expand=True)
         self._refresh_books()
 
     def _add_book(self):
+        form = self._book_form  # mirrored values; no Tcl calls on submit
+        if form["avail"] is None:
+            messagebox.showerror("Error", "Available must be a whole number")
+            return
         try:
             b = Book(
-                title=self.b_title.get().strip(),
-                author=self.b_author.get().strip(),
-                genre=self.b_genre.get().strip(),
-                isbn=self.b_isbn.get().strip(),
-                available=int(self.b_avail.get() or 1),
+                title=form["title"].strip(),
+                author=form["author"].strip(),
+                genre=form["genre"].strip(),
+                isbn=form["isbn"].strip(),
+                available=int(form["avail"] or 1),
             )
-            bid = self.db.add_book(b)
-            messagebox.showinfo("Success", f"Book added with ID {bid}")
-            self._refresh_books()
-        except ValidationError as e:
-            messagebox.showerror("Validation", str(e))
-        except Exception as e:
+        except ValueError as e:
             messagebox.showerror("Error", str(e))
+            return
+        self._db_call("add_book", (b,), self._on_book_added)
+
+    def _on_book_added(self, result):
+        if isinstance(result, Exception):
+            self._show_db_error(result)
+            return
+        messagebox.showinfo("Success", f"Book added with ID {result}")
+        self._refresh_books()
 
     def _update_book(self):
+        form = self._book_form
         try:
-            bid = int(self.b_id.get())
-            self.db.update_book(bid, self.b_title.get().strip(), self.b_author.get().strip(),
-                                self.b_genre.get().strip(), self.b_isbn.get().strip(), int(self.b_avail.get()))
-            messagebox.showinfo("Updated", "Book updated")
-            self._refresh_books()
-        except ValueError:
-            messagebox.showerror("Error", "Enter a valid Book ID")
-        except ValidationError as e:
-            messagebox.showerror("Validation", str(e))
+            bid = int(form["id"])
+            avail = int(form["avail"])  # None sentinel fails here too
+        except (ValueError, TypeError):
+            messagebox.showerror("Error", "Enter a valid Book ID and Available count")
+            return
+        self._db_call("update_book",
+                      (bid, form["title"].strip(), form["author"].strip(),
+                       form["genre"].strip(), form["isbn"].strip(), avail),
+                      self._on_book_updated)
+
+    def _on_book_updated(self, result):
+        if isinstance(result, Exception):
+            self._show_db_error(result)
+            return
+        messagebox.showinfo("Updated", "Book updated")
+        self._refresh_books()
 
     def _refresh_books(self):
-        for r in self.books_tree.get_children():
-            self.books_tree.delete(r)
-        for row in self.db.list_books():
-            self.books_tree.insert("", "end", values=(row["book_id"], row["title"], row["author"], row["genre"], row["isbn"], row["available"]))
+        self._db_call("count_books", (), self._set_books_total)
+        self._db_call("page_books", (max(self._books_loaded, self._PAGE), 0),
+                      self._apply_books)
+
+    def _set_books_total(self, total):
+        if not isinstance(total, Exception):
+            self._books_total = total
+
+    def _apply_books(self, rows):
+        if isinstance(rows, Exception):
+            return
+        self._sync_tree(self.books_tree, self._books_iids,
+                        ((row[0], tuple(row)) for row in rows))
+        self._books_loaded = len(rows)
+
+    def _on_books_scroll(self, first, last):
+        if (float(last) > 0.9 and not self._books_loading
+                and self._books_loaded < self._books_total):
+            self._books_loading = True
+            self._db_call("page_books", (self._PAGE, self._books_loaded),
+                          self._append_books)
+
+    def _append_books(self, rows):
+        self._books_loading = False
+        if isinstance(rows, Exception):
+            return
+        _ins = self.books_tree.insert
+        for row in rows:
+            pk = row[0]
+            if pk not in self._books_iids:
+                self._books_iids[pk] = _ins("", "end", values=tuple(row))
+        self._books_loaded += len(rows)
 
     # ---------- Borrow/Return UI ----------
     def _build_borrow_tab(self):
@@ -478,6 +883,7 @@ class LibraDeskApp(tk.Tk):
         # Active loans table
         l2 = ttk.LabelFrame(frm, text="Active Loans / Return")
         l2.pack(fill="both", expand=True, padx=10, pady=10)
+        self._loans_iids = {}
         self.tx_tree = ttk.Treeview(l2, columns=("tx","member","book","borrowed","due"), show="headings")
         for col, head in zip(("tx","member","book","borrowed","due"), ("TX ID","Member","Book","Borrowed","Due")):
             self.tx_tree.heading(col, text=head)
@@ -494,26 +900,43 @@ class LibraDeskApp(tk.Tk):
 
     def _borrow(self):
         try:
-            self.db.borrow_book(int(self.br_member.get()), int(self.br_book.get()), int(self.br_days.get()))
-            messagebox.showinfo("Borrowed", "Book checked out")
-            self._refresh_loans()
-            self._refresh_books()
-        except (ValidationError, ValueError) as e:
+            args = (int(self.br_member.get()), int(self.br_book.get()), int(self.br_days.get()))
+        except (ValueError, tk.TclError) as e:
             messagebox.showerror("Error", str(e))
+            return
+        self._db_call("borrow_book", args, self._on_borrowed)
+
+    def _on_borrowed(self, result):
+        if isinstance(result, Exception):
+            self._show_db_error(result)
+            return
+        messagebox.showinfo("Borrowed", "Book checked out")
+        self._refresh_loans()
+        self._refresh_books()
 
     def _return_common(self, as_csv=False):
         try:
-            fine = self.db.return_book(int(self.ret_tx.get()))
-            self._refresh_loans()
-            self._refresh_books()
-            # find row to make invoice
-            for row in self.db.history():
-                if row["tx_id"] == int(self.ret_tx.get()):
-                    path = self.invoice_gen.write_invoice(row, as_csv=as_csv)
-                    messagebox.showinfo("Returned", f"Fine: ₹{fine}\nInvoice saved:\n{path}")
-                    return
-        except (ValidationError, ValueError) as e:
-            messagebox.showerror("Error", str(e))
+            tx_id = int(self.ret_tx.get())
+        except ValueError:
+            messagebox.showerror("Error", "Enter a valid TX ID")
+            return
+        self._db_call("return_book", (tx_id,),
+                      lambda fine: self._on_returned(fine, tx_id, as_csv))
+
+    def _on_returned(self, fine, tx_id, as_csv):
+        if isinstance(fine, Exception):
+            self._show_db_error(fine)
+            return
+        self._refresh_loans()
+        self._refresh_books()
+        self._db_call("get_tx", (tx_id,),
+                      lambda row: self._on_tx_fetched(row, fine, as_csv))
+
+    def _on_tx_fetched(self, row, fine, as_csv):
+        if isinstance(row, Exception) or row is None:
+            return
+        path = self.invoice_gen.write_invoice(row, as_csv=as_csv)
+        messagebox.showinfo("Returned", f"Fine: ₹{fine}\nInvoice saved:\n{path}")
 
     def _return_txt(self):
         self._return_common(as_csv=False)
@@ -522,10 +945,14 @@ class LibraDeskApp(tk.Tk):
         self._return_common(as_csv=True)
 
     def _refresh_loans(self):
-        for r in self.tx_tree.get_children():
-            self.tx_tree.delete(r)
-        for row in self.db.active_loans():
-            self.tx_tree.insert("", "end", values=(row["tx_id"], row["member_name"], row["book_title"], row["borrow_date"][:10], row["due_date"]))
+        self._db_call("active_loans", (), self._apply_loans)
+
+    def _apply_loans(self, rows):
+        if isinstance(rows, Exception):
+            return
+        self._sync_tree(self.tx_tree, self._loans_iids,
+                        ((row[0], (row[0], row[1], row[2], row[3][:10], row[4]))
+                         for row in rows))
 
     # ---------- Search & Reports ----------
     def _build_search_tab(self):
@@ -545,17 +972,22 @@ class LibraDeskApp(tk.Tk):
 
     def _search_books(self):
         pat = self.search_pattern.get().strip()
-        rows = self.db.list_books(pattern=pat)
+        self._db_call("list_books", (pat,), self._apply_search_books)
+
+    def _apply_search_books(self, rows):
+        if isinstance(rows, Exception):
+            self._show_db_error(rows)
+            return
         self._fill_search([("Book", r["title"], r["author"], r["isbn"]) for r in rows])
 
     def _overdue_list(self):
-        out = []
-        today = datetime.now().date()
-        for r in self.db.active_loans():
-            due = datetime.fromisoformat(r["due_date"]).date()
-            if due < today:
-                out.append(("Overdue", r["member_name"], r["book_title"], str((today - due).days)+" days"))
-        self._fill_search(out)
+        self._db_call("overdue_loans", (), self._apply_overdue)
+
+    def _apply_overdue(self, rows):
+        if isinstance(rows, Exception):
+            return
+        self._fill_search([("Overdue", r["member_name"], r["book_title"],
+                            f"{r['overdue_days']} days") for r in rows])
 
     def _fill_search(self, rows):
         for r in self.search_tree.get_children():
@@ -565,13 +997,17 @@ class LibraDeskApp(tk.Tk):
 
 # ---------- Seed data on first run ----------
 def seed_if_empty(db: LibraryDB):
-    if not db.list_members():
-        db.add_member(Member(name="Alice Sharma", email="alice@example.com"))
-        db.add_member(Member(name="Bob Khan", email="bob@example.com"))
-    if not db.list_books():
-        db.add_book(Book(title="Python Crash Course", author="Eric Matthes", genre="Programming", isbn="9781593276034", available=3))
-        db.add_book(Book(title="Clean Code", author="Robert C. Martin", genre="Software", isbn="9780132350884", available=2))
-        db.add_book(Book(title="Atomic Habits", author="James Clear", genre="Self-help", isbn="9780735211292", available=5))
+    if next(db.iter_members(), None) is None:
+        db.add_members_bulk([
+            Member(name="Alice Sharma", email="alice@example.com"),
+            Member(name="Bob Khan", email="bob@example.com"),
+        ])
+    if next(db.iter_books(), None) is None:
+        db.add_books_bulk([
+            Book(title="Python Crash Course", author="Eric Matthes", genre="Programming", isbn="9781593276034", available=3),
+            Book(title="Clean Code", author="Robert C. Martin", genre="Software", isbn="9780132350884", available=2),
+            Book(title="Atomic Habits", author="James Clear", genre="Self-help", isbn="9780735211292", available=5),
+        ])
 
 if __name__ == "__main__":
     app = LibraDeskApp()